@@ -5,13 +5,19 @@ Clean separation of concerns:
 - Target: What to investigate
 - Step: Plan item (future work)
 - Evidence: Result item (completed work)
+- RiskIndicator: Risk signal carried by evidence
 - Investigation: Process coordination
 - RiskReport: Final assessment
 """
 
+from typing import Any
+
+from pydantic import BaseModel
+
 from .enums import CostTier, InvestigationStatus, RiskLevel, TargetType
 from .evidence import Evidence
 from .investigation import Investigation
+from .risk_indicator import RiskIndicator
 from .risk_report import RiskReport
 from .step import Step
 from .target import Target
@@ -24,6 +30,25 @@ __all__ = [
     "Target",
     "Step",
     "Evidence",
+    "RiskIndicator",
     "Investigation",
     "RiskReport",
+    "is_model",
 ]
+
+
+def is_model(cls: Any) -> bool:
+    """
+    True if `cls` is a domain model class (pydantic BaseModel or dataclass).
+
+    Use this instead of `issubclass(cls, BaseModel)` for dispatch: repeated
+    `issubclass` checks against BaseModel have been reported to leak through
+    the ABC subclass cache when many model classes are created dynamically
+    (pydantic issue discussion on `create_model`), while a direct `__mro__`
+    scan allocates nothing. Do not "simplify" this back to `issubclass`.
+    """
+    if not isinstance(cls, type):
+        return False
+    if "__pydantic_fields__" in cls.__dict__ and "__dataclass_fields__" in cls.__dict__:
+        return True
+    return any(base is BaseModel for base in cls.__mro__)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+import os
+import tempfile
+from functools import lru_cache
+from typing import Optional
+from ._hashing import content_hash
+
+# Directory large raw payloads are spilled to. Unset disables spilling and
+# keeps payloads inline on the model.
+ARTIFACT_DIR_ENV = "NOIR_ARTIFACT_DIR"
+
+# Payloads longer than this (in characters) are spilled when enabled.
+SPILL_THRESHOLD = 1024
+
+
+def spill_artifact(content: str) -> Optional[str]:
+    """
+    Write `content` to the artifact directory and return its path.
+
+    Files are content-addressed, so identical payloads (e.g. the same WHOIS
+    dump fetched twice) share one file. Returns None when no artifact
+    directory is configured.
+    """
+    directory = os.environ.get(ARTIFACT_DIR_ENV)
+    if not directory:
+        return None
+
+    data = content.encode("utf-8")
+    # "blake2b:<hex>" -> "blake2b-<hex>.raw" (no ':' in file names)
+    path = os.path.join(directory, content_hash(data).replace(":", "-") + ".raw")
+    if not os.path.exists(path):
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    return path
+
+
+def load_artifact(path: str) -> Optional[str]:
+    """
+    Read a spilled artifact back (recently used ones stay cached).
+
+    Only files inside the artifact directory are read. Returns None when
+    `path` resolves anywhere else, no directory is configured, or the
+    file no longer exists.
+    """
+    directory = os.environ.get(ARTIFACT_DIR_ENV)
+    if not directory:
+        return None
+    root = os.path.realpath(directory)
+    resolved = os.path.realpath(path)
+    if os.path.commonpath([root, resolved]) != root:
+        return None
+    try:
+        return _read_artifact(resolved)
+    except FileNotFoundError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _read_artifact(path: str) -> str:
+    with open(path, encoding="utf-8") as fh:
+        return fh.read()
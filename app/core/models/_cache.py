@@ -0,0 +1,84 @@
+from __future__ import annotations
+import os
+import sqlite3
+import threading
+from typing import Optional
+
+# Where the risk score cache lives. Unset keeps it in memory for the
+# lifetime of the process; point it at a file to share it across runs.
+SCORE_CACHE_PATH_ENV = "NOIR_SCORE_CACHE_PATH"
+
+# Reports kept by the score cache; older writes are evicted first.
+SCORE_CACHE_MAX_ENTRIES = 1024
+
+
+class KeyValueCache:
+    """
+    Small persistent string -> string cache backed by one SQLite table.
+
+    The connection is opened lazily on first use. Writes are single
+    `INSERT OR REPLACE` statements committed immediately, so a crash never
+    leaves a partially written entry behind. With `max_entries` set, each
+    write also evicts the least recently written entries beyond that bound
+    (a replaced key counts as freshly written).
+    """
+
+    def __init__(self, path: str = ":memory:", max_entries: Optional[int] = None):
+        self.path = path
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = (
+                self._connection()
+                .execute("SELECT value FROM cache WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+                if self.max_entries is not None:
+                    # REPLACE reinserts, so rowid order is write order
+                    conn.execute(
+                        "DELETE FROM cache WHERE rowid <= (SELECT rowid FROM cache"
+                        " ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                        (self.max_entries,),
+                    )
+
+    def clear(self) -> None:
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+score_cache = KeyValueCache(
+    os.environ.get(SCORE_CACHE_PATH_ENV, ":memory:"),
+    max_entries=SCORE_CACHE_MAX_ENTRIES,
+)
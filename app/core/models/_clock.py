@@ -0,0 +1,27 @@
+from __future__ import annotations
+import time
+from datetime import datetime, timezone
+from typing import Tuple
+
+# Records created within this window share one timestamp object.
+_RESOLUTION_S = 0.001
+
+_last: Tuple[float, datetime] = (float("-inf"), datetime.min.replace(tzinfo=timezone.utc))
+
+
+def cached_utcnow() -> datetime:
+    """
+    Timezone-aware UTC now, reused for up to 1 ms.
+
+    Default factory for model timestamps: bursts of records (e.g. evidence
+    from parallel steps) share one `datetime` instead of each building its
+    own. The cached pair is swapped as a single tuple so concurrent callers
+    never see a torn update.
+    """
+    global _last
+    t = time.monotonic()
+    stamp, now = _last
+    if t - stamp > _RESOLUTION_S:
+        now = datetime.now(timezone.utc)
+        _last = (t, now)
+    return now
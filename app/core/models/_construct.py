@@ -0,0 +1,134 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, Optional, Tuple, Type, TypeVar
+from pydantic_core import PydanticUndefined
+
+T = TypeVar("T")
+
+# Per class: (field name, slot setter, default, default_factory, init).
+_FieldPlan = Tuple[
+    str, Callable[[Any, Any], None], Any, Optional[Callable[[], Any]], bool
+]
+_plans: Dict[type, Tuple[_FieldPlan, ...]] = {}
+
+
+def _plan_for(cls: type) -> Tuple[_FieldPlan, ...]:
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = tuple(
+            (
+                name,
+                cls.__dict__[name].__set__,
+                info.default,
+                info.default_factory,
+                info.init is not False,
+            )
+            for name, info in cls.__pydantic_fields__.items()
+        )
+    return plan
+
+
+def construct_trusted(cls: Type[T], **values: Any) -> T:
+    """
+    Build a slotted pydantic dataclass instance without running validation.
+
+    Equivalent of `BaseModel.model_construct` for the frozen dataclass
+    models: values are stored as given and missing fields take their
+    declared defaults. Fields declared with `init=False` cannot be passed,
+    as with the regular constructor. `__post_init__` still runs, as it does
+    after validation (Evidence relies on it to spill large raw payloads).
+    Only use it for data the application produced itself; external input
+    must go through the regular constructor.
+    """
+    obj = object.__new__(cls)
+    matched = 0
+    for name, set_value, default, default_factory, init in _plan_for(cls):
+        if init and name in values:
+            set_value(obj, values[name])
+            matched += 1
+        elif default_factory is not None:
+            set_value(obj, default_factory())
+        elif default is not PydanticUndefined:
+            set_value(obj, default)
+        else:
+            raise TypeError(f"{cls.__name__} missing required field: {name!r}")
+    if matched != len(values):
+        accepted = {name for name, *_, init in _plan_for(cls) if init}
+        unknown = sorted(values.keys() - accepted)
+        raise TypeError(f"{cls.__name__} got unexpected fields: {unknown}")
+    post_init = getattr(cls, "__post_init__", None)
+    if post_init is not None:
+        post_init(obj)
+    return obj
+
+
+def construct_trusted_partial(cls: Type[T], **bound: Any) -> Callable[..., T]:
+    """
+    `construct_trusted` with some field values bound up front.
+
+    Returns `build(**values)` where `values` must supply exactly the init
+    fields missing from `bound` (their defaults are not applied);
+    `init=False` fields still take their defaults. The field plan is
+    resolved once here, so each build is only the slot writes -- for hot
+    paths stamping out many instances from one template.
+    """
+    fixed = []
+    free = []
+    derived = []
+    for name, set_value, default, default_factory, init in _plan_for(cls):
+        if not init:
+            derived.append((set_value, default, default_factory))
+        elif name in bound:
+            fixed.append((set_value, bound[name]))
+        else:
+            free.append((name, set_value))
+    if len(fixed) != len(bound):
+        accepted = {name for name, *_, init in _plan_for(cls) if init}
+        unknown = sorted(bound.keys() - accepted)
+        raise TypeError(f"{cls.__name__} got unexpected fields: {unknown}")
+    free_names = frozenset(name for name, _ in free)
+    post_init = getattr(cls, "__post_init__", None)
+
+    def build(**values: Any) -> T:
+        if values.keys() != free_names:
+            raise TypeError(
+                f"{cls.__name__} expects fields {sorted(free_names)}, "
+                f"got {sorted(values)}"
+            )
+        obj = object.__new__(cls)
+        for set_value, value in fixed:
+            set_value(obj, value)
+        for name, set_value in free:
+            set_value(obj, values[name])
+        for set_value, default, default_factory in derived:
+            set_value(
+                obj, default_factory() if default_factory is not None else default
+            )
+        if post_init is not None:
+            post_init(obj)
+        return obj
+
+    return build
+
+
+class TrustedConstructMixin:
+    """Adds the trusted `model_construct*` constructors to the slotted models."""
+
+    __slots__ = ()
+
+    @classmethod
+    def model_construct(cls: Type[T], **values: Any) -> T:
+        """
+        Build an instance from trusted values without running validation.
+
+        For data produced inside the application; external input must go
+        through the regular constructor. See `construct_trusted`.
+        """
+        return construct_trusted(cls, **values)
+
+    @classmethod
+    def model_construct_partial(cls: Type[T], **bound: Any) -> Callable[..., T]:
+        """
+        Bind trusted values for some fields once; the returned callable
+        builds instances from the rest. See `construct_trusted_partial`.
+        """
+        return construct_trusted_partial(cls, **bound)
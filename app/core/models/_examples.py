@@ -0,0 +1,110 @@
+"""
+Documented examples for the domain models' JSON schemas.
+
+Imported lazily by `._schema.add_example`; keep this module out of the
+regular import path.
+"""
+
+from typing import Any, Dict
+
+EXAMPLES: Dict[str, Dict[str, Any]] = {
+    "Evidence": {
+        "source": "whois",
+        "step_id": "step_whois_001",
+        "target_value": "suspicious-deals.com",
+        "data": {
+            "domain": "suspicious-deals.com",
+            "creation_date": "2025-01-10T00:00:00Z",
+            "registrar": "Namecheap Inc.",
+            "privacy_protected": True,
+        },
+        "risk_indicators": [
+            {
+                "type": "new_domain",
+                "severity": "high",
+                "detail": "Domain registered 5 days ago",
+                "score_impact": 25,
+            }
+        ],
+        "confidence": 0.95,
+        "timestamp": "2025-01-15T10:05:30Z",
+        "cost_tier": "free",
+        "raw_response": "Domain Name: SUSPICIOUS-DEALS.COM\\nCreation Date: 2025-01-10T00:00:00Z...",
+    },
+    "Investigation": {
+        "id": "inv_20250115_001",
+        "target": {
+            "value": "suspicious-deals.com",
+            "type": "domain",
+            "normalized_value": "suspicious-deals.com",
+            "created_at": "2025-01-15T10:00:00Z",
+            "metadata": {"original_input": "suspicious-deals.com"},
+        },
+        "status": "completed",
+        "plan": [
+            {
+                "id": "step_whois_001",
+                "primitive": "whois",
+                "params": {"domain": "suspicious-deals.com"},
+                "label": "WHOIS Domain Lookup",
+                "cost_tier": "free",
+            }
+        ],
+        "evidence_collected": [
+            {
+                "source": "whois",
+                "step_id": "step_whois_001",
+                "target_value": "suspicious-deals.com",
+                "confidence": 0.95,
+                "cost_tier": "free",
+            }
+        ],
+        "started_at": "2025-01-15T10:00:00Z",
+        "completed_at": "2025-01-15T10:08:45Z",
+        "demo_mode": False,
+        "settings": {"max_cost_tier": "basic", "timeout_total_s": 300},
+    },
+    "RiskReport": {
+        "target_value": "suspicious-deals.com",
+        "score": 75,
+        "level": "high",
+        "confidence": 0.87,
+        "explanation": "High risk domain: newly registered with privacy protection and suspicious naming pattern",
+        "evidence_summary": [
+            "Domain registered only 5 days ago",
+            "WHOIS privacy protection enabled",
+            "Domain name contains suspicious keywords",
+        ],
+        "recommended_actions": [
+            "Exercise extreme caution before visiting",
+            "Verify legitimacy through alternative channels",
+            "Consider blocking domain in security tools",
+        ],
+        "generated_at": "2025-01-15T10:08:45Z",
+        "investigation_id": "inv_20250115_001",
+        "metadata": {
+            "scoring_model": "noir_ai_v1.0",
+            "evidence_count": 2,
+            "processing_time_ms": 525,
+        },
+    },
+    "Step": {
+        "id": "step_whois_001",
+        "primitive": "whois",
+        "params": {"domain": "suspicious-deals.com"},
+        "parallel": False,
+        "label": "WHOIS Domain Lookup",
+        "timeout_s": 30,
+        "cost_tier": "free",
+    },
+    "Target": {
+        "value": "suspicious-deals.com",
+        "type": "domain",
+        "normalized_value": "suspicious-deals.com",
+        "created_at": "2025-01-15T10:00:00Z",
+        "metadata": {
+            "original_input": "suspicious-deals.com",
+            "user_agent": "NoirAI/1.0",
+        },
+    },
+}
@@ -0,0 +1,14 @@
+from __future__ import annotations
+import hashlib
+from typing import Optional
+
+
+def content_hash(raw: bytes, key: Optional[bytes] = None) -> str:
+    """
+    Content hash for evidence payloads, spilled artifacts, cache keys and
+    report metadata, as `"blake2b:<hex digest>"`.
+
+    Pass `key` (up to 64 bytes) for a keyed MAC suitable for tamper-evident
+    audit records; without it this is a plain BLAKE2b digest.
+    """
+    return "blake2b:" + hashlib.blake2b(raw, key=key or b"").hexdigest()
@@ -0,0 +1,97 @@
+from __future__ import annotations
+import sys
+from typing import Dict, Any, Annotated
+from pydantic import (
+    AfterValidator,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    model_validator,
+)
+from pydantic_core import ArgsKwargs
+
+
+def _require_dict(value: Any) -> Dict[str, Any]:
+    if not isinstance(value, dict):
+        raise ValueError("expected a JSON object")
+    return value
+
+
+JsonObject = Annotated[
+    Dict[str, Any],
+    PlainValidator(_require_dict, json_schema_input_type=Dict[str, Any]),
+]
+"""
+Opaque, pass-through JSON object.
+
+Only checks that the value is a dict and keeps it as-is: no per-key
+validation and no copy. Use for payloads the models carry but never
+interpret (tool output, settings, report metadata).
+"""
+
+
+InternedStr = Annotated[str, AfterValidator(sys.intern)]
+"""
+String interned after validation.
+
+For low-cardinality values repeated across many records (source and
+primitive names, target values) so equal values share one object.
+"""
+
+
+# Decimal places kept when a confidence is written to JSON.
+CONFIDENCE_DECIMALS = 3
+
+
+def _quantize_confidence(value: float) -> float:
+    return round(value, CONFIDENCE_DECIMALS)
+
+
+Confidence = Annotated[
+    float,
+    Field(ge=0.0, le=1.0),
+    PlainSerializer(_quantize_confidence, when_used="json"),
+]
+"""
+Confidence in [0.0, 1.0].
+
+Kept at full precision in memory but quantized to `CONFIDENCE_DECIMALS`
+places on the JSON wire, so computed values like 0.8000000000000002 go
+out as 0.8.
+"""
+
+
+def _read_attributes(cls: type, data: Any) -> Any:
+    if isinstance(data, (dict, ArgsKwargs)) or hasattr(data, "__pydantic_fields__"):
+        return data
+    return {
+        name: getattr(data, name)
+        for name in cls.__dataclass_fields__
+        if hasattr(data, name)
+    }
+
+
+read_attributes = model_validator(mode="before")(_read_attributes)
+"""
+Before-validator giving pydantic dataclasses `from_attributes` behaviour.
+
+pydantic-core only reads attributes for BaseModel fields; a nested
+dataclass rejects anything that isn't a dict or an instance. Assign this
+in the class body (`_read_attributes = read_attributes`) so ORM-style
+objects feeding `Investigation.model_validate` are read field by field.
+"""
+
+
+def add_example(schema: Dict[str, Any], cls: type) -> None:
+    """
+    `json_schema_extra` hook attaching the documented example for `cls`.
+
+    Examples live in `._examples` and are only imported when a JSON schema
+    is actually generated (e.g. FastAPI serving /openapi.json), so worker
+    processes never load or retain them.
+    """
+    from ._examples import EXAMPLES
+
+    example = EXAMPLES.get(cls.__name__)
+    if example is not None:
+        schema["example"] = example
@@ -1,7 +1,7 @@
-from enum import Enum
+from enum import StrEnum
 
 
-class CostTier(str, Enum):
+class CostTier(StrEnum):
     """Cost tiers for operations and evidence acquisition"""
 
     FREE = "free"
@@ -9,7 +9,7 @@ class CostTier(str, Enum):
     PREMIUM = "premium"
 
 
-class InvestigationStatus(str, Enum):
+class InvestigationStatus(StrEnum):
     """Enumeration of current investigation status."""
 
     PENDING = "pending"
@@ -20,7 +20,7 @@ class InvestigationStatus(str, Enum):
     FAILED = "failed"
 
 
-class RiskLevel(str, Enum):
+class RiskLevel(StrEnum):
     """Severity buckets for aggregated risk."""
 
     LOW = "low"
@@ -29,7 +29,7 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
-class TargetType(str, Enum):
+class TargetType(StrEnum):
     """Supported investigation target categories."""
 
     IP = "ip"
@@ -1,23 +1,48 @@
 # backend/app/core/models/evidence.py
 from __future__ import annotations
-from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Annotated
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Final, Union
 
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import Field, ConfigDict, TypeAdapter, field_serializer
+from pydantic.dataclasses import dataclass
+from pydantic.json_schema import SkipJsonSchema
 
+from ._artifacts import SPILL_THRESHOLD, load_artifact, spill_artifact
+from ._clock import cached_utcnow
+from ._construct import TrustedConstructMixin
+from ._schema import (
+    Confidence,
+    InternedStr,
+    JsonObject,
+    add_example,
+    read_attributes,
+)
 from .enums import CostTier
+from .risk_indicator import RiskIndicator
 
 
-class Evidence(BaseModel):
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        defer_build=True,
+        from_attributes=True,
+        json_schema_extra=add_example,
+    ),
+)
+class Evidence(TrustedConstructMixin):
     """
     Single piece of evidence gathered during an investigation.
 
     - `data` should be structured (parsed) output.
     - `raw_response` is preserved for debugging/audit and should not be used
-      directly for scoring without parsing.
+      directly for scoring without parsing. Large payloads are spilled to
+      the artifact directory (when configured) and only `raw_response_ref`
+      is kept in memory; use `load_raw_response()` to read it back.
+      Serialized output always carries the full text and never the path.
     """
 
-    source: str = Field(
+    source: InternedStr = Field(
         ...,
         description="Primitive or tool that produced this evidence (e.g., whois, web_search).",
     )
@@ -25,66 +50,95 @@ class Evidence(BaseModel):
         None,
         description="ID of the step that produced this evidence (links to Step.id).",
     )
-    target_value: str = Field(
+    target_value: InternedStr = Field(
         ...,
         description="Canonical target value this evidence is about (e.g., example.com).",
+        repr=False,
     )
-    data: Dict[str, Any] = Field(
+    data: JsonObject = Field(
         default_factory=dict,
         description="Structured/parsed result extracted from the raw response.",
+        repr=False,
     )
-    risk_indicators: List[Dict[str, Any]] = Field(
+    risk_indicators: List[RiskIndicator] = Field(
         default_factory=list,
-        description="Signals or flags (indicator name + metadata) implying risk.",
+        description="Signals or flags implying risk.",
+        repr=False,
     )
-    confidence: Annotated[float, Field(ge=0.0, le=1.0)] = Field(
+    confidence: Confidence = Field(
         ..., description="Confidence in this piece of evidence (0.0–1.0)."
     )
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=cached_utcnow,
         description="When the evidence was captured (UTC, timezone-aware).",
+        repr=False,
     )
     cost_tier: CostTier = Field(
         default=CostTier.FREE,
         description="Acquisition cost tier for this evidence.",
+        repr=False,
     )
     raw_response: str = Field(
         "",
-        description="Unprocessed raw output from the source (kept for debugging/audit).",
+        description=(
+            "Unprocessed raw output from the source (kept for debugging/audit). "
+            "Empty in memory once spilled to disk; read it with "
+            "load_raw_response()."
+        ),
+        repr=False,
     )
-
-    model_config = ConfigDict(
-        from_attributes=True,
-        use_enum_values=True,
-        json_schema_extra={
-            "example": {
-                "source": "whois",
-                "step_id": "step_whois_001",
-                "target_value": "suspicious-deals.com",
-                "data": {
-                    "domain": "suspicious-deals.com",
-                    "creation_date": "2025-01-10T00:00:00Z",
-                    "registrar": "Namecheap Inc.",
-                    "privacy_protected": True,
-                },
-                "risk_indicators": [
-                    {
-                        "type": "new_domain",
-                        "severity": "high",
-                        "detail": "Domain registered 5 days ago",
-                        "score_impact": 25,
-                    }
-                ],
-                "confidence": 0.95,
-                "timestamp": "2025-01-15T10:05:30Z",
-                "cost_tier": "free",
-                "raw_response": "Domain Name: SUSPICIOUS-DEALS.COM\\nCreation Date: 2025-01-10T00:00:00Z...",
-            }
-        },
+    # Only ever set by __post_init__: accepting it as input would let a
+    # client point it at any file and have serialization read it back.
+    raw_response_ref: SkipJsonSchema[Optional[str]] = Field(
+        None,
+        description="Artifact path holding raw_response once spilled to disk.",
+        init=False,
+        exclude=True,
+        repr=False,
     )
 
+    _read_attributes = read_attributes
+
+    def __post_init__(self) -> None:
+        if len(self.raw_response) > SPILL_THRESHOLD:
+            ref = spill_artifact(self.raw_response)
+            if ref is not None:
+                object.__setattr__(self, "raw_response", "")
+                object.__setattr__(self, "raw_response_ref", ref)
+
+    @field_serializer("raw_response")
+    def _serialize_raw_response(self, raw_response: str) -> str:
+        return self.load_raw_response()
+
+    def load_raw_response(self) -> str:
+        """
+        Raw source output, read back from its artifact if it was spilled.
+
+        Empty if the artifact can no longer be read.
+        """
+        if self.raw_response_ref is not None:
+            return load_artifact(self.raw_response_ref) or ""
+        return self.raw_response
+
+    @classmethod
+    def validate_many(cls, raw: List[Dict[str, Any]]) -> List[Evidence]:
+        """Validate a batch of raw evidence dicts in a single pydantic-core call."""
+        return EVIDENCE_LIST_ADAPTER.validate_python(raw)
+
+    @classmethod
+    def validate_many_json(cls, data: Union[str, bytes]) -> List[Evidence]:
+        """Parse and validate a JSON array of evidence in a single pydantic-core call."""
+        return EVIDENCE_LIST_ADAPTER.validate_json(data)
+
+    @staticmethod
+    def dump_many_json(items: List[Evidence]) -> bytes:
+        """Serialize evidence to a JSON array in a single pydantic-core call."""
+        return EVIDENCE_LIST_ADAPTER.dump_json(items)
+
     def __str__(self) -> str:
         return f"<Evidence {self.source} for {self.target_value} (confidence={self.confidence:.2f})>"
 
-    def __repr__(self) -> str:
-        return f"Evidence(source={self.source!r}, step_id={self.step_id!r}, confidence={self.confidence!r})"
+
+EVIDENCE_LIST_ADAPTER: Final = TypeAdapter(
+    List[Evidence], config=ConfigDict(defer_build=True)
+)
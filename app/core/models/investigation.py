@@ -1,10 +1,12 @@
 from __future__ import annotations
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import Any, Iterator, List, Optional, Tuple
 from pydantic import BaseModel, Field, ConfigDict
 from .target import Target
 from .step import Step
 from .evidence import Evidence
+from ._clock import cached_utcnow
+from ._schema import JsonObject, add_example
 from .enums import InvestigationStatus
 
 
@@ -32,7 +34,7 @@ class Investigation(BaseModel):
         description="Evidence gathered during execution.",
     )
     started_at: datetime = Field(
-        default_factory=datetime.utcnow, description="When the investigation started."
+        default_factory=cached_utcnow, description="When the investigation started (UTC)."
     )
     completed_at: Optional[datetime] = Field(
         None, description="When the investigation completed (populated on finish)."
@@ -40,56 +42,51 @@ class Investigation(BaseModel):
     demo_mode: bool = Field(
         default=False, description="Whether the investigation was run in demo mode."
     )
-    settings: Dict[str, Any] = Field(
+    settings: JsonObject = Field(
         default_factory=dict,
         description="Optional runtime settings for the investigation (non-sensitive).",
     )
 
     model_config = ConfigDict(
+        defer_build = True,
         from_attributes = True,
-        use_enum_values = True,
-        json_schema_extra = {
-            "example": {
-                "id": "inv_20250115_001",
-                "target": {
-                    "value": "suspicious-deals.com",
-                    "type": "domain",
-                    "normalized_value": "suspicious-deals.com",
-                    "created_at": "2025-01-15T10:00:00Z",
-                    "metadata": {"original_input": "suspicious-deals.com"},
-                },
-                "status": "completed",
-                "plan": [
-                    {
-                        "id": "step_whois_001",
-                        "primitive": "whois",
-                        "params": {"domain": "suspicious-deals.com"},
-                        "label": "WHOIS Domain Lookup",
-                        "cost_tier": "free",
-                    }
-                ],
-                "evidence_collected": [
-                    {
-                        "source": "whois",
-                        "step_id": "step_whois_001",
-                        "target_value": "suspicious-deals.com",
-                        "confidence": 0.95,
-                        "cost_tier": "free",
-                    }
-                ],
-                "started_at": "2025-01-15T10:00:00Z",
-                "completed_at": "2025-01-15T10:08:45Z",
-                "demo_mode": False,
-                "settings": {"max_cost_tier": "basic", "timeout_total_s": 300},
-            }
-        }
+        validate_assignment = False,
+        json_schema_extra = add_example,
     )
 
+    def append_evidence(self, evidence: Evidence) -> None:
+        """
+        Record a new piece of evidence as it streams in from a primitive.
+
+        Appends in place without re-validating the collected list. When
+        `settings["max_evidence"]` is set, only the most recent that many
+        items are retained.
+        """
+        collected = self.evidence_collected
+        collected.append(evidence)
+        limit = self._max_evidence()
+        if limit is not None and len(collected) > limit:
+            # Normally one item over, i.e. a single small memmove
+            del collected[: len(collected) - limit]
+
+    def _max_evidence(self) -> Optional[int]:
+        limit = self.settings.get("max_evidence")
+        if limit is None:
+            return None
+        # settings is opaque JSON: reject anything but a plain int rather
+        # than let int() quietly accept True, 2.9 or "2"
+        if type(limit) is not int or limit < 0:
+            raise ValueError(
+                "settings['max_evidence'] must be a non-negative integer, "
+                f"got {limit!r}"
+            )
+        return limit
+
     def __str__(self) -> str:
-        return f"<Investigation {self.id} status={self.status.value}>"
+        return f"<Investigation {self.id} status={self.status}>"
 
-    def __repr__(self) -> str:
-        return (
-            f"Investigation(id={self.id!r}, target={self.target.normalized_value!r}, "
-            f"status={self.status!r}, evidence_count={len(self.evidence_collected)})"
-        )
+    def __repr_args__(self) -> Iterator[Tuple[str, Any]]:
+        yield "id", self.id
+        yield "target", self.target.normalized_value
+        yield "status", self.status
+        yield "evidence_count", len(self.evidence_collected)
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import dataclasses
+from array import array
+from typing import TYPE_CHECKING, Iterable, List
+from pydantic import Field, ConfigDict
+from pydantic.dataclasses import dataclass
+from ._schema import read_attributes
+from .enums import RiskLevel
+
+if TYPE_CHECKING:
+    from .evidence import Evidence
+
+
+
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        defer_build=True,
+        from_attributes=True,
+    ),
+)
+class RiskIndicator:
+    """
+    Single risk signal attached to a piece of evidence.
+
+    `score_impact` is the number of points this signal contributes to the
+    composite risk score.
+    """
+
+    type: str = Field(
+        ..., description="Indicator name (e.g., new_domain, privacy_protected)."
+    )
+    severity: RiskLevel = Field(
+        ..., description="How serious this signal is on its own."
+    )
+    detail: str = Field(
+        "", description="Short human-readable explanation of the signal."
+    )
+    # Bounded to the 0–100 score scale; IndicatorColumns stores it in a
+    # C int array, which would overflow on arbitrary Python ints.
+    score_impact: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description="Points this signal adds to the risk score.",
+    )
+
+    _read_attributes = read_attributes
+
+    def __str__(self) -> str:
+        return f"<RiskIndicator {self.type} ({self.severity})>"
+
+
+@dataclasses.dataclass(slots=True)
+class IndicatorColumns:
+    """
+    Column-oriented view of the risk indicators of a batch of evidence.
+
+    Row `i` across the columns is one indicator. Scoring reads these
+    columns directly instead of walking every `RiskIndicator` object.
+    """
+
+    types: List[str] = dataclasses.field(default_factory=list)
+    details: List[str] = dataclasses.field(default_factory=list)
+    score_impacts: array = dataclasses.field(default_factory=lambda: array("i"))
+
+    @classmethod
+    def from_evidence(cls, evidence: Iterable[Evidence]) -> IndicatorColumns:
+        cols = cls()
+        for ev in evidence:
+            for indicator in ev.risk_indicators:
+                cols.types.append(indicator.type)
+                cols.details.append(indicator.detail)
+                cols.score_impacts.append(indicator.score_impact)
+        return cols
+
+    def __len__(self) -> int:
+        return len(self.score_impacts)
@@ -1,8 +1,45 @@
 from __future__ import annotations
-from datetime import datetime, timezone
-from typing import List, Dict, Any, Annotated
-from pydantic import BaseModel, Field, ConfigDict
+import json
+import math
+from datetime import datetime
+from typing import (
+    Any, Dict, Iterator, List, Annotated, Mapping, Optional, Sequence, Tuple
+)
+from pydantic import (
+    BaseModel,
+    Field,
+    ConfigDict,
+    GetJsonSchemaHandler,
+    computed_field,
+    field_serializer,
+    model_validator,
+)
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import CoreSchema
+from ._cache import score_cache
+from ._clock import cached_utcnow
+from ._hashing import content_hash
+from ._schema import Confidence, InternedStr, JsonObject, add_example
 from .enums import RiskLevel
+from .evidence import EVIDENCE_LIST_ADAPTER, Evidence
+from .investigation import Investigation
+from .risk_indicator import IndicatorColumns
+
+# Lower bound of each level, highest first; anything below is LOW.
+_LEVEL_THRESHOLDS = (
+    (85, RiskLevel.CRITICAL),
+    (60, RiskLevel.HIGH),
+    (30, RiskLevel.MEDIUM),
+)
+_MAX_SUMMARY_ITEMS = 5
+_SUMMARY_DESCRIPTION = "Key findings that materially influenced the score."
+# Part of every score cache key. Bump it whenever compute_from_evidence
+# changes, so a persistent cache (NOIR_SCORE_CACHE_PATH) stops serving
+# reports from the old algorithm.
+_SCORING_VERSION = "1"
+# Evidence fields that feed the score; the cache key ignores everything else
+# (timestamps, raw output) so re-running an investigation can hit the cache.
+_SCORED_EVIDENCE_FIELDS = {"source", "step_id", "confidence", "risk_indicators"}
 
 
 class RiskReport(BaseModel):
@@ -12,10 +49,13 @@ class RiskReport(BaseModel):
     - `score` is an integer 0–100 representing the composite risk.
     - `confidence` is the model/evidence confidence for this assessment (0.0–1.0).
     - `evidence_summary` should be short, human-readable bullets pulled from evidence.
+      They are stored packed into one string plus start offsets and split
+      back out on access as a tuple; assign a new sequence (or pass it to
+      `model_copy(update=...)`) to change them.
     - `recommended_actions` are prioritized suggestions for the user.
     """
 
-    target_value: str = Field(
+    target_value: InternedStr = Field(
         ..., description="Canonical target value assessed (e.g., example.com)."
     )
     score: Annotated[int, Field(ge=0, le=100)] = Field(
@@ -24,64 +64,263 @@ class RiskReport(BaseModel):
     level: RiskLevel = Field(
         ..., description="Categorical risk level derived from the score."
     )
-    confidence: Annotated[float, Field(ge=0.0, le=1.0)] = Field(
+    confidence: Confidence = Field(
         ..., description="Confidence in this assessment (0.0–1.0)."
     )
     explanation: str = Field(
         ..., description="Short human-readable explanation for the assessment."
     )
-    evidence_summary: List[str] = Field(
-        default_factory=list,
-        description="Key findings that materially influenced the score.",
+    evidence_summary_packed: str = Field(
+        default="",
+        exclude=True,
+        repr=False,
+        description="All evidence_summary bullets concatenated.",
+    )
+    evidence_summary_offsets: Tuple[int, ...] = Field(
+        default=(),
+        exclude=True,
+        repr=False,
+        description="Start offset of each bullet within evidence_summary_packed.",
     )
     recommended_actions: List[str] = Field(
         default_factory=list,
         description="Concrete next steps for the user (prioritized).",
     )
     generated_at: datetime = Field(
-        default_factory=(lambda : datetime.now(timezone.utc)), description="When this report was generated."
+        default_factory=cached_utcnow, description="When this report was generated."
     )
     investigation_id: str = Field(
         ..., description="ID of the investigation that produced this report."
     )
-    metadata: Dict[str, Any] = Field(
+    metadata: JsonObject = Field(
         default_factory=dict,
         description="Optional metadata (model used, prompt hash, version info).",
     )
 
     model_config = ConfigDict(
+        defer_build = True,
         from_attributes = True,
-        use_enum_values = True,
-        json_schema_extra = {
-            "example": {
-                "target_value": "suspicious-deals.com",
-                "score": 75,
-                "level": "high",
-                "confidence": 0.87,
-                "explanation": "High risk domain: newly registered with privacy protection and suspicious naming pattern",
-                "evidence_summary": [
-                    "Domain registered only 5 days ago",
-                    "WHOIS privacy protection enabled",
-                    "Domain name contains suspicious keywords",
-                ],
-                "recommended_actions": [
-                    "Exercise extreme caution before visiting",
-                    "Verify legitimacy through alternative channels",
-                    "Consider blocking domain in security tools",
-                ],
-                "generated_at": "2025-01-15T10:08:45Z",
-                "investigation_id": "inv_20250115_001",
-                "metadata": {
-                    "scoring_model": "noir_ai_v1.0",
-                    "evidence_count": 2,
-                    "processing_time_ms": 525,
-                },
-            }
-        }
+        json_schema_extra = add_example,
     )
 
+    @model_validator(mode="before")
+    @classmethod
+    def _pack_evidence_summary(cls, data: Any) -> Any:
+        if isinstance(data, (dict, RiskReport)):
+            pass
+        elif hasattr(data, "evidence_summary"):
+            # from_attributes only reads declared fields, so an ORM-style
+            # object's evidence_summary would be silently dropped
+            data = {
+                name: getattr(data, name)
+                for name in (*cls.model_fields, "evidence_summary")
+                if hasattr(data, name)
+            }
+        if isinstance(data, dict) and "evidence_summary" in data:
+            data = dict(data)
+            packed, offsets = _pack(data.pop("evidence_summary"))
+            data["evidence_summary_packed"] = packed
+            data["evidence_summary_offsets"] = offsets
+        return data
+
+    @model_validator(mode="after")
+    def _check_evidence_summary_offsets(self) -> RiskReport:
+        position = 0
+        for offset in self.evidence_summary_offsets:
+            if offset < position:
+                raise ValueError(
+                    "evidence_summary_offsets must be non-negative and non-decreasing"
+                )
+            position = offset
+        if position > len(self.evidence_summary_packed):
+            raise ValueError("evidence_summary_offsets out of range")
+        return self
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, core_schema: CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        json_schema = handler(core_schema)
+        if handler.mode == "validation":
+            # Clients send evidence_summary; the packed fields are internal
+            model_schema = handler.resolve_ref_schema(json_schema)
+            properties = {}
+            for name, prop in model_schema["properties"].items():
+                if name == "evidence_summary_packed":
+                    properties["evidence_summary"] = {
+                        "description": _SUMMARY_DESCRIPTION,
+                        "items": {"type": "string"},
+                        "title": "Evidence Summary",
+                        "type": "array",
+                    }
+                elif name != "evidence_summary_offsets":
+                    properties[name] = prop
+            model_schema["properties"] = properties
+        return json_schema
+
+    @computed_field(description=_SUMMARY_DESCRIPTION)
+    @property
+    def evidence_summary(self) -> Tuple[str, ...]:
+        # A tuple, not a list: appending to a copy would be silently lost
+        packed = self.evidence_summary_packed
+        offsets = self.evidence_summary_offsets
+        ends = offsets[1:] + (len(packed),)
+        return tuple(packed[start:end] for start, end in zip(offsets, ends))
+
+    @evidence_summary.setter
+    def evidence_summary(self, items: Sequence[str]) -> None:
+        self.evidence_summary_packed, self.evidence_summary_offsets = _pack(items)
+
+    @field_serializer("evidence_summary")
+    def _serialize_evidence_summary(self, items: Tuple[str, ...]) -> List[str]:
+        return list(items)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> RiskReport:
+        # model_copy skips validation, so repack evidence_summary here;
+        # otherwise it would be set as a stray attribute and ignored
+        if update and "evidence_summary" in update:
+            update = dict(update)
+            packed, offsets = _pack(update.pop("evidence_summary"))
+            update["evidence_summary_packed"] = packed
+            update["evidence_summary_offsets"] = offsets
+        return super().model_copy(update=update, deep=deep)
+
+    @classmethod
+    def compute_from_evidence(
+        cls, investigation_id: str, target_value: str, evidence: List[Evidence]
+    ) -> RiskReport:
+        """
+        Score a target from the evidence collected for it.
+
+        Indicators of the same type are one risk factor reported by possibly
+        several sources, so each factor contributes its MAX `score_impact`;
+        the composite score is the SUM over factors, clipped to 0–100.
+        Confidence is the mean confidence of the evidence. The result does
+        not depend on the order of `evidence`.
+        """
+        cols = IndicatorColumns.from_evidence(evidence)
+
+        factor_max: Dict[str, int] = {}
+        for factor, impact in zip(cols.types, cols.score_impacts):
+            best = factor_max.get(factor)
+            if best is None or impact > best:
+                factor_max[factor] = impact
+        score = min(100, max(0, sum(factor_max.values())))
+
+        # Highest impact first, ties broken by text, so the report does not
+        # depend on evidence order (the score cache key doesn't either)
+        findings = sorted(
+            (-impact, detail or factor)
+            for impact, detail, factor in zip(
+                cols.score_impacts, cols.details, cols.types
+            )
+        )
+        summary: List[str] = []
+        for _, finding in findings:
+            if finding not in summary:
+                summary.append(finding)
+                if len(summary) == _MAX_SUMMARY_ITEMS:
+                    break
+
+        if factor_max:
+            explanation = (
+                f"{len(factor_max)} risk factor(s) found across "
+                f"{len(evidence)} piece(s) of evidence"
+            )
+        else:
+            explanation = (
+                f"No risk indicators found in {len(evidence)} piece(s) of evidence"
+            )
+
+        # fsum is exactly rounded, so the mean is independent of order too
+        confidence = (
+            math.fsum(ev.confidence for ev in evidence) / len(evidence)
+            if evidence
+            else 0.0
+        )
+
+        return cls(
+            target_value=target_value,
+            score=score,
+            level=_level_for_score(score),
+            confidence=confidence,
+            explanation=explanation,
+            evidence_summary=summary,
+            investigation_id=investigation_id,
+            metadata={"evidence_count": len(evidence), "indicator_count": len(cols)},
+        )
+
+    @classmethod
+    def from_investigation(cls, investigation: Investigation) -> RiskReport:
+        """
+        Score an investigation, reusing a cached report for identical evidence.
+
+        Reports are cached by scoring version, target and scored evidence
+        content (at full precision); a hit is re-labelled with this
+        investigation's id and a fresh `generated_at`.
+        """
+        target_value = investigation.target.normalized_value
+        evidence = investigation.evidence_collected
+        key = _score_cache_key(target_value, evidence)
+
+        cached = score_cache.get(key)
+        if cached is not None:
+            return cls.model_validate_json(cached).model_copy(
+                update={
+                    "investigation_id": investigation.id,
+                    "generated_at": cached_utcnow(),
+                }
+            )
+
+        report = cls.compute_from_evidence(investigation.id, target_value, evidence)
+        report.metadata["evidence_hash"] = key
+        payload = report.model_dump(mode="json")
+        # The JSON wire format rounds confidence; cache it at full precision
+        payload["confidence"] = report.confidence
+        score_cache.set(key, json.dumps(payload))
+        return report
+
     def __str__(self) -> str:
-        return f"<RiskReport target={self.target_value} score={self.score} level={self.level.value}>"
+        return f"<RiskReport target={self.target_value} score={self.score} level={self.level}>"
+
+    def __repr_args__(self) -> Iterator[Tuple[str, Any]]:
+        yield "target_value", self.target_value
+        yield "score", self.score
+        yield "level", self.level
+
+
+def _score_cache_key(target_value: str, evidence: List[Evidence]) -> str:
+    # Python mode keeps confidences unrounded (json.dumps writes floats with
+    # repr), so evidence differing only past CONFIDENCE_DECIMALS gets its own
+    # key. Severities are StrEnums and serialize as their values.
+    scored = EVIDENCE_LIST_ADAPTER.dump_python(
+        evidence, include={"__all__": _SCORED_EVIDENCE_FIELDS}
+    )
+    digests = sorted(
+        content_hash(json.dumps(item, sort_keys=True).encode()) for item in scored
+    )
+    return content_hash(
+        "\n".join([_SCORING_VERSION, target_value, *digests]).encode()
+    )
+
+
+def _level_for_score(score: int) -> RiskLevel:
+    for threshold, level in _LEVEL_THRESHOLDS:
+        if score >= threshold:
+            return level
+    return RiskLevel.LOW
+
 
-    def __repr__(self) -> str:
-        return f"RiskReport(target_value={self.target_value!r}, score={self.score}, level={self.level!r})"
+def _pack(items: Any) -> Tuple[str, Tuple[int, ...]]:
+    if not isinstance(items, (list, tuple)) or not all(
+        isinstance(item, str) for item in items
+    ):
+        raise ValueError("evidence_summary must be a list of strings")
+    offsets = []
+    position = 0
+    for item in items:
+        offsets.append(position)
+        position += len(item)
+    return "".join(items), tuple(offsets)
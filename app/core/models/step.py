@@ -1,10 +1,22 @@
 from __future__ import annotations
-from typing import Dict, Any, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Dict, List, Any, Optional, Final, Union
+from pydantic import Field, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
+from ._construct import TrustedConstructMixin, construct_trusted
+from ._schema import InternedStr, add_example
 from .enums import CostTier
 
 
-class Step(BaseModel):
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        defer_build=True,
+        from_attributes=True,
+        json_schema_extra=add_example,
+    ),
+)
+class Step(TrustedConstructMixin):
     """
     Planner -> Orchestrator step contract.
 
@@ -13,44 +25,62 @@ class Step(BaseModel):
     """
 
     id: str = Field(..., description="Unique step id (planner assigned).")
-    primitive: str = Field(
+    primitive: InternedStr = Field(
         ..., description="Name of the primitive/task to execute (e.g., 'whois')."
     )
     params: Dict[str, Any] = Field(
-        default_factory=dict, description="Structured parameters for the primitive."
+        default_factory=dict,
+        description="Structured parameters for the primitive.",
+        repr=False,
     )
     parallel: bool = Field(
-        default=False, description="If true, this step can be executed concurrently."
+        default=False,
+        description="If true, this step can be executed concurrently.",
+        repr=False,
     )
     label: Optional[str] = Field(
-        None, description="Optional human-friendly label for UI display."
+        None,
+        description="Optional human-friendly label for UI display.",
+        repr=False,
     )
     timeout_s: Optional[int] = Field(
-        None, description="Optional per-step timeout in seconds."
+        None,
+        description="Optional per-step timeout in seconds.",
+        repr=False,
     )
     cost_tier: CostTier = Field(
         default=CostTier.FREE,
         description="Expected acquisition cost tier for this step.",
     )
 
-    model_config = ConfigDict(
-        from_attributes = True,
-        use_enum_values = True,
-        json_schema_extra = {
-            "example": {
-                "id": "step_whois_001",
-                "primitive": "whois",
-                "params": {"domain": "suspicious-deals.com"},
-                "parallel": False,
-                "label": "WHOIS Domain Lookup",
-                "timeout_s": 30,
-                "cost_tier": "free",
-            }
-        }
-    )
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None) -> Step:
+        """
+        Shallow copy with `update` applied, without re-validation.
+
+        Mirrors `BaseModel.model_copy`; `update` values must already be valid.
+        """
+        values = {name: getattr(self, name) for name in self.__pydantic_fields__}
+        if update:
+            values.update(update)
+        return construct_trusted(type(self), **values)
+
+    @classmethod
+    def validate_many(cls, raw: List[Dict[str, Any]]) -> List[Step]:
+        """Validate a batch of raw step dicts in a single pydantic-core call."""
+        return STEP_LIST_ADAPTER.validate_python(raw)
+
+    @classmethod
+    def validate_many_json(cls, data: Union[str, bytes]) -> List[Step]:
+        """Parse and validate a JSON array of steps in a single pydantic-core call."""
+        return STEP_LIST_ADAPTER.validate_json(data)
+
+    @staticmethod
+    def dump_many_json(items: List[Step]) -> bytes:
+        """Serialize steps to a JSON array in a single pydantic-core call."""
+        return STEP_LIST_ADAPTER.dump_json(items)
 
     def __str__(self) -> str:
-        return f"<Step {self.id}: {self.primitive} ({self.cost_tier.value})>"
+        return f"<Step {self.id}: {self.primitive} ({self.cost_tier})>"
+
 
-    def __repr__(self) -> str:
-        return f"Step(id={self.id!r}, primitive={self.primitive!r}, cost_tier={self.cost_tier!r})"
+STEP_LIST_ADAPTER: Final = TypeAdapter(List[Step], config=ConfigDict(defer_build=True))
@@ -1,11 +1,25 @@
 from __future__ import annotations
-from datetime import datetime, timezone
-from typing import Dict, Any
-from pydantic import BaseModel, Field, ConfigDict
+from datetime import datetime
+from typing import Dict, Any, Final, Optional
+from pydantic import Field, ConfigDict, TypeAdapter
+from pydantic.dataclasses import dataclass
+from ._clock import cached_utcnow
+from ._construct import TrustedConstructMixin
+from ._schema import add_example, read_attributes
 from .enums import TargetType
 
 
-class Target(BaseModel):
+@dataclass(
+    frozen=True,
+    slots=True,
+    config=ConfigDict(
+        defer_build=True,
+        from_attributes=True,
+        extra="ignore",
+        json_schema_extra=add_example,
+    ),
+)
+class Target(TrustedConstructMixin):
     """
     Canonical representation of an investigation target.
 
@@ -24,33 +38,59 @@ class Target(BaseModel):
         description="Cleaned, normalized representation used for lookups (e.g. 'example.com').",
     )
     created_at: datetime = Field(
-        default_factory=(lambda: datetime.now(timezone.utc)),
+        default_factory=cached_utcnow,
         description="When this Target object was created.",
+        repr=False,
     )
     metadata: Dict[str, Any] = Field(
         default_factory=dict,
         description="Optional additional context (extracted fields, source, notes).",
+        repr=False,
     )
 
-    model_config = ConfigDict(
-        from_attributes = True,
-        use_enum_values = True,
-        json_schema_extra = {
-            "example": {
-                "value": "suspicious-deals.com",
-                "type": "domain",
-                "normalized_value": "suspicious-deals.com",
-                "created_at": "2025-01-15T10:00:00Z",
-                "metadata": {
-                    "original_input": "suspicious-deals.com",
-                    "user_agent": "NoirAI/1.0",
-                },
-            }
-        }
-    )
+    _read_attributes = read_attributes
+
+    @classmethod
+    def fast_domain(cls, value: str) -> Target:
+        """Build a domain target from trusted input, skipping validation."""
+        return cls.from_trusted(value, TargetType.DOMAIN, value.strip().lower())
+
+    @classmethod
+    def fast_ip(cls, value: str) -> Target:
+        """Build an IP target from trusted input, skipping validation."""
+        return cls.from_trusted(value, TargetType.IP, value.strip().lower())
+
+    @classmethod
+    def fast_url(cls, value: str) -> Target:
+        """Build a URL target from trusted input, skipping validation."""
+        return cls.from_trusted(value, TargetType.URL, value.strip())
+
+    @classmethod
+    def fast_company(cls, value: str) -> Target:
+        """Build a company target from trusted input, skipping validation."""
+        return cls.from_trusted(value, TargetType.COMPANY, value.strip().lower())
+
+    @classmethod
+    def from_trusted(
+        cls,
+        value: str,
+        type: TargetType,
+        normalized_value: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Target:
+        """Build a Target from trusted, already-normalized values (no validation)."""
+        return cls.model_construct(
+            value=value,
+            type=type,
+            normalized_value=normalized_value,
+            created_at=cached_utcnow(),
+            metadata=metadata or {},
+        )
 
     def __str__(self) -> str:
-        return f"<Target {self.type.value}: {self.normalized_value}>"
+        return f"<Target {self.type}: {self.normalized_value}>"
+
 
-    def __repr__(self) -> str:
-        return f"Target(value={self.value!r}, type={self.type!r}, normalized_value={self.normalized_value!r})"
+# Built once; (de)serializes Target for API and storage code. Its schema is
+# still only built on first use.
+TARGET_ADAPTER: Final = TypeAdapter(Target)
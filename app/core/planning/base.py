@@ -21,6 +21,10 @@ class BasePlanner(ABC):
     Planners decide what steps to take during an investigation.
     - MockPlanner: returns a fixed deterministic plan (for dev/demo).
     - BedrockPlanner: queries an LLM to reason about targets and evidence.
+
+    The interface is async so LLM-backed planners can await I/O. Planners
+    that never await may do the work in a plain method and have
+    `create_plan`/`adapt_plan` just return its result.
     """
 
     def __init__(self, name: str):
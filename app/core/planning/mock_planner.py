@@ -1,123 +1,191 @@
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from app.core.models.enums import CostTier, TargetType
+from app.core.models.enums import CostTier, RiskLevel, TargetType
 from app.core.models.step import Step
 from app.core.models.target import Target
 from app.core.models.evidence import Evidence
 from app.core.planning.base import BasePlanner, PlannerError
 
+# Builds a step's params from (normalized target value, demo mode).
+ParamsBuilder = Callable[[str, bool], Dict[str, Any]]
+# Validated Step field values, minus the per-target id and params
+StepFields = Dict[str, Any]
+# (Step constructor with id and validated fields bound, params builder) for
+# one step of a plan shape
+StepTemplate = Tuple[Callable[..., Step], ParamsBuilder]
+
+
+# Primitive names, interned so comparisons against Step.primitive (itself
+# interned on validation) hit the identity fast path
+_PRIM_WHOIS = sys.intern("whois")
+_PRIM_WEB_SEARCH = sys.intern("web_search")
+_PRIM_REPUTATION = sys.intern("reputation")
+_PRIM_NEWS_SEARCH = sys.intern("news_search")
+_PRIM_RISK_SCORE = sys.intern("risk_score")
+
+_SUPPORTED = frozenset({TargetType.DOMAIN, TargetType.URL, TargetType.IP})
+# Listed in enum order so the error message is stable across runs
+_SUPPORTED_STR = ", ".join(t.value for t in TargetType if t in _SUPPORTED)
+# Target types whose plans start with a WHOIS lookup
+_WHOIS_TYPES = frozenset({TargetType.DOMAIN, TargetType.URL})
+
+_REPUTATION_ENGINES = ("virustotal", "safebrowsing")
+_SCAM_QUERY_SUFFIX = " scam OR complaints OR fraud"
+# Copied into each plan rather than shared: Step.params must stay a plain
+# dict (pydantic cannot serialize a MappingProxyType to JSON), and callers
+# are free to mutate their own plan.
+_RISK_SCORE_PARAMS: Dict[str, Any] = {
+    "aggregation_method": "weighted_average",
+    "confidence_threshold": 0.7,
+}
+
+
+def _whois_params(value: str, demo_mode: bool) -> Dict[str, Any]:
+    return {"domain": value}
+
+
+def _web_search_params(value: str, demo_mode: bool) -> Dict[str, Any]:
+    return {"query": value, "max_results": 5 if demo_mode else 3}
+
+
+def _reputation_params(value: str, demo_mode: bool) -> Dict[str, Any]:
+    # A list, not the tuple itself, so plans round-trip through JSON unchanged
+    return {"target": value, "engines": list(_REPUTATION_ENGINES)}
+
+
+def _news_search_params(value: str, demo_mode: bool) -> Dict[str, Any]:
+    return {"query": value + _SCAM_QUERY_SUFFIX, "days_back": 30}
+
+
+def _risk_score_params(value: str, demo_mode: bool) -> Dict[str, Any]:
+    return dict(_RISK_SCORE_PARAMS)
+
+
+def _step_fields(**fields: Any) -> StepFields:
+    """Validate a step template once and return its field values."""
+    step = Step(id="template", **fields)
+    return {
+        name: getattr(step, name)
+        for name in Step.__pydantic_fields__
+        if name not in ("id", "params")
+    }
+
 
 class MockPlanner(BasePlanner):
     """
     Produces a deterministic sequence of Steps for a given target.
+
+    The plan shape only depends on the target type and whether news search
+    is included, so step templates (ids included) are validated once per
+    combination in `__init__` and bound with `Step.model_construct_partial`;
+    planning builds each Step from those values plus the per-target params,
+    leaving no branching on the hot path. Every call builds fresh Steps
+    with their own `params`, so callers may mutate the plan they get.
+
+    Invariant: MockPlanner returns pre-validated Step objects. Everything
+    except id and params comes from a validated template, and the ids and
+    params built here are plain str / dict, so skipping validation on the
+    hot path cannot produce a Step that `Step(...)` would reject.
     """
 
     def __init__(self):
         super().__init__(name="mock")
-        self._supported_types = {TargetType.DOMAIN, TargetType.URL, TargetType.IP}
-
-    async def create_plan(
-        self, target: Target, context: Optional[Dict[str, Any]] = None
-    ) -> List[Step]:
-        """Create a deterministic investigation plan."""
-
-        # Validate target type
-        if target.type not in self._supported_types:
-            raise PlannerError(
-                f"MockPlanner doesn't support target type: {target.type}. "
-                f"Supported types: {', '.join(t.value for t in self._supported_types)}"
+        self._templates = self._build_templates()
+        self._build_adaptive_news = Step.model_construct_partial(
+            **_step_fields(
+                primitive=_PRIM_NEWS_SEARCH,
+                label="Deep News Search (High Risk Detected)",
+                cost_tier=CostTier.BASIC,
+                timeout_s=30,
+                parallel=False,
             )
+        )
 
-        context = context or {}
-        demo_mode = context.get("demo", False)
-        step_counter = 1
-
-        steps: List[Step] = []
-
-        # Always start with WHOIS for domains/IPs
-        if target.type in {TargetType.DOMAIN, TargetType.URL}:
-            steps.append(
-                Step(
-                    id=f"step_{target.type}_{step_counter:03d}",
-                    primitive="whois",
-                    params={"domain": target.normalized_value},
-                    label="WHOIS Domain Lookup",
-                    cost_tier=CostTier.FREE,
-                    timeout_s=30,
-                    parallel=False,
-                )
-            )
-            step_counter += 1
-
-        # Web search for general information
-        steps.append(
-            Step(
-                id=f"step_{target.type}_{step_counter:03d}",
-                primitive="web_search",
-                params={
-                    "query": target.normalized_value,
-                    "max_results": 5 if demo_mode else 3,
-                },
+    def _build_templates(
+        self,
+    ) -> Dict[Tuple[TargetType, bool], List[StepTemplate]]:
+        whois = (
+            _step_fields(
+                primitive=_PRIM_WHOIS,
+                label="WHOIS Domain Lookup",
+                cost_tier=CostTier.FREE,
+                timeout_s=30,
+                parallel=False,
+            ),
+            _whois_params,
+        )
+        web_search = (
+            _step_fields(
+                primitive=_PRIM_WEB_SEARCH,
                 label="Web Search",
                 cost_tier=CostTier.FREE,
                 timeout_s=15,
                 parallel=True,  # Can run in parallel with reputation
-            )
+            ),
+            _web_search_params,
         )
-        step_counter += 1
-
-        # Reputation check (can run parallel with web search)
-        steps.append(
-            Step(
-                id=f"step_{target.type}_{step_counter:03d}",
-                primitive="reputation",
-                params={
-                    "target": target.normalized_value,
-                    "engines": ["virustotal", "safebrowsing"],
-                },
+        reputation = (
+            _step_fields(
+                primitive=_PRIM_REPUTATION,
                 label="Reputation Check",
                 cost_tier=CostTier.FREE,
                 timeout_s=20,
                 parallel=True,
-            )
+            ),
+            _reputation_params,
         )
-        step_counter += 1
-
-        # Add news search in demo mode or if specifically requested
-        if demo_mode or context.get("include_news", False):
-            steps.append(
-                Step(
-                    id=f"step_{target.type}_{step_counter:03d}",
-                    primitive="news_search",
-                    params={
-                        "query": f"{target.normalized_value} scam OR complaints OR fraud",
-                        "days_back": 30,
-                    },
-                    label="News & Complaint Search",
-                    cost_tier=CostTier.BASIC,
-                    timeout_s=25,
-                    parallel=False,
-                )
-            )
-            step_counter += 1
-
-        # Always end with risk scoring (depends on all previous steps)
-        steps.append(
-            Step(
-                id=f"step_{target.type}_{step_counter:03d}",
-                primitive="risk_score",
-                params={
-                    "aggregation_method": "weighted_average",
-                    "confidence_threshold": 0.7,
-                },
+        news_search = (
+            _step_fields(
+                primitive=_PRIM_NEWS_SEARCH,
+                label="News & Complaint Search",
+                cost_tier=CostTier.BASIC,
+                timeout_s=25,
+                parallel=False,
+            ),
+            _news_search_params,
+        )
+        risk_score = (
+            _step_fields(
+                primitive=_PRIM_RISK_SCORE,
                 label="Risk Assessment",
                 cost_tier=CostTier.FREE,
                 timeout_s=5,
                 parallel=False,
-            )
+            ),
+            _risk_score_params,
         )
 
-        return steps
+        templates = {}
+        for target_type in _SUPPORTED:
+            for with_news in (False, True):
+                steps = [
+                    # Always start with WHOIS for domains/URLs
+                    *((whois,) if target_type in _WHOIS_TYPES else ()),
+                    # Web search and reputation check run in parallel
+                    web_search,
+                    reputation,
+                    *((news_search,) if with_news else ()),
+                    # Always end with risk scoring (depends on all previous steps)
+                    risk_score,
+                ]
+                # Step ids only depend on the plan shape, e.g. "step_domain_001"
+                templates[(target_type, with_news)] = [
+                    (
+                        Step.model_construct_partial(
+                            id=f"step_{target_type.value}_{n:03d}", **fields
+                        ),
+                        build_params,
+                    )
+                    for n, (fields, build_params) in enumerate(steps, 1)
+                ]
+        return templates
+
+    async def create_plan(
+        self, target: Target, context: Optional[Dict[str, Any]] = None
+    ) -> List[Step]:
+        """Create a deterministic investigation plan."""
+        return self._build_plan(target, context)
 
     async def adapt_plan(
         self, current_plan: List[Step], evidence: List[Evidence]
@@ -130,45 +198,71 @@ class MockPlanner(BasePlanner):
         - Skip remaining steps if confidence is very high/low
         - Add specialized primitives based on findings
         """
+        return self._adapt_plan(current_plan, evidence)
+
+    def _build_plan(
+        self, target: Target, context: Optional[Dict[str, Any]]
+    ) -> List[Step]:
+        target_type = target.type
+        # Validate target type
+        if target_type not in _SUPPORTED:
+            raise PlannerError(
+                f"MockPlanner doesn't support target type: {target_type}. "
+                f"Supported types: {_SUPPORTED_STR}"
+            )
+
+        demo_mode = bool(context and context.get("demo"))
+        include_news = bool(context and context.get("include_news"))
+        value = target.normalized_value
 
+        # Add news search in demo mode or if specifically requested
+        with_news = demo_mode or include_news
+        return [
+            build_step(params=build_params(value, demo_mode))
+            for build_step, build_params in self._templates[(target_type, with_news)]
+        ]
+
+    def _adapt_plan(
+        self, current_plan: List[Step], evidence: List[Evidence]
+    ) -> List[Step]:
         if not evidence:
             return current_plan
 
         # Simple adaptation: if we find high-risk indicators, add deeper investigation
         high_risk_found = any(
-            any(indicator.get("severity") == "high" for indicator in ev.risk_indicators)
+            indicator.severity == RiskLevel.HIGH
             for ev in evidence
+            for indicator in ev.risk_indicators
         )
 
         if high_risk_found:
-            # Check if we already have news search
-            has_news_search = any(
-                step.primitive == "news_search" for step in current_plan
-            )
-
-            if not has_news_search:
-                # Insert news search before the final risk_score step
-                risk_score_idx = next(
-                    i
-                    for i, step in enumerate(current_plan)
-                    if step.primitive == "risk_score"
-                )
+            # One pass: do we already have news search, and where is risk_score?
+            news_idx = risk_score_idx = -1
+            for i, step in enumerate(current_plan):
+                primitive = step.primitive
+                if primitive == _PRIM_NEWS_SEARCH:
+                    news_idx = i
+                    break
+                if primitive == _PRIM_RISK_SCORE and risk_score_idx == -1:
+                    risk_score_idx = i
 
-                news_step = Step(
+            if news_idx == -1:
+                # Insert news search before the final risk_score step (or
+                # append it if the plan has none)
+                if risk_score_idx == -1:
+                    risk_score_idx = len(current_plan)
+                news_step = self._build_adaptive_news(
                     id=f"step_adaptive_{len(current_plan):03d}",
-                    primitive="news_search",
                     params={
-                        "query": f"{evidence[0].target_value} scam OR complaints OR fraud",
+                        "query": evidence[0].target_value + _SCAM_QUERY_SUFFIX,
                         "days_back": 90,  # Longer search for high-risk cases
                     },
-                    label="Deep News Search (High Risk Detected)",
-                    cost_tier=CostTier.BASIC,
-                    timeout_s=30,
-                    parallel=False,
                 )
 
-                adapted_plan = current_plan.copy()
-                adapted_plan.insert(risk_score_idx, news_step)
-                return adapted_plan
+                return [
+                    *current_plan[:risk_score_idx],
+                    news_step,
+                    *current_plan[risk_score_idx:],
+                ]
 
         return current_plan
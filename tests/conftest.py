@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+# tests/ sits directly under the repository root
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+if not (REPO_ROOT / "app").is_dir():
+    # Layout changed: fall back to searching upwards for the app package
+    for p in Path(__file__).resolve().parents:
+        if (p / "app").is_dir():
+            REPO_ROOT = p
+            break
+
+sys.path.insert(0, str(REPO_ROOT))
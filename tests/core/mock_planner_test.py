@@ -11,7 +11,7 @@ from app.core.planning.mock_planner import MockPlanner
 @pytest.mark.asyncio
 async def test_create_plan_demo_mode():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="https://Example.COM/page",
         type=TargetType.DOMAIN,
         normalized_value="example.com",
@@ -43,7 +43,7 @@ async def test_create_plan_demo_mode():
 @pytest.mark.asyncio
 async def test_create_plan_non_demo_mode():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="example.com",
         type=TargetType.DOMAIN,
         normalized_value="example.com",
@@ -65,7 +65,7 @@ async def test_create_plan_non_demo_mode():
 @pytest.mark.asyncio
 async def test_create_plan_unsupported_target_type():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="Acme Corporation",
         type=TargetType.COMPANY,
         normalized_value="acme corporation",
@@ -80,7 +80,7 @@ async def test_create_plan_unsupported_target_type():
 @pytest.mark.asyncio
 async def test_adapt_plan_with_high_risk_evidence():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="suspicious.com",
         type=TargetType.DOMAIN,
         normalized_value="suspicious.com",
@@ -125,7 +125,7 @@ async def test_adapt_plan_with_high_risk_evidence():
 @pytest.mark.asyncio
 async def test_adapt_plan_no_evidence():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="example.com",
         type=TargetType.DOMAIN,
         normalized_value="example.com",
@@ -141,7 +141,7 @@ async def test_adapt_plan_no_evidence():
 @pytest.mark.asyncio
 async def test_step_id_generation():
     planner = MockPlanner()
-    target = Target(
+    target = Target.from_trusted(
         value="test.com",
         type=TargetType.DOMAIN,
         normalized_value="test.com",
@@ -152,3 +152,57 @@ async def test_step_id_generation():
     # Check ID format and uniqueness
     for i, step in enumerate(plan, 1):
         assert step.id == f"step_domain_{i:03d}"
+
+
+@pytest.mark.asyncio
+async def test_create_plan_is_deterministic():
+    planner = MockPlanner()
+    target = Target.from_trusted(
+        value="example.com",
+        type=TargetType.DOMAIN,
+        normalized_value="example.com",
+    )
+
+    first = await planner.create_plan(target, context={"demo": True})
+    other = await planner.create_plan(target)
+    second = await planner.create_plan(target, context={"demo": True})
+
+    assert second == first
+    assert second is not first
+    assert len(other) < len(first)
+
+
+@pytest.mark.asyncio
+async def test_mutating_a_returned_plan_does_not_affect_later_plans():
+    planner = MockPlanner()
+    target = Target.fast_domain("example.com")
+
+    first = await planner.create_plan(target)
+    first[0].params["domain"] = "evil.com"
+    second = await planner.create_plan(target)
+
+    assert second[0].params == {"domain": "example.com"}
+
+
+@pytest.mark.asyncio
+async def test_risk_score_params_are_not_shared_between_plans():
+    domain = await MockPlanner().create_plan(Target.fast_domain("example.com"))
+    domain[-1].params["confidence_threshold"] = 0.0
+
+    ip = await MockPlanner().create_plan(
+        Target.from_trusted(
+            value="192.0.2.1", type=TargetType.IP, normalized_value="192.0.2.1"
+        )
+    )
+
+    assert ip[-1].params["confidence_threshold"] == 0.7
+    assert Step.validate_many_json(Step.dump_many_json(ip[-1:])) == ip[-1:]
+
+
+@pytest.mark.asyncio
+async def test_plan_round_trips_through_json():
+    plan = await MockPlanner().create_plan(
+        Target.fast_domain("example.com"), context={"demo": True}
+    )
+
+    assert Step.validate_many_json(Step.dump_many_json(plan)) == plan
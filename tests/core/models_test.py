@@ -0,0 +1,456 @@
+import json
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from app.core.models import is_model
+from app.core.models._artifacts import load_artifact
+from app.core.models.enums import CostTier, RiskLevel, TargetType
+from app.core.models.evidence import Evidence
+from app.core.models.investigation import Investigation
+from app.core.models.risk_indicator import IndicatorColumns, RiskIndicator
+from app.core.models.risk_report import RiskReport
+from app.core.models.step import Step
+from app.core.models.target import TARGET_ADAPTER, Target
+
+
+def test_evidence_validate_many():
+    evidence = Evidence.validate_many(
+        [
+            {"source": "whois", "target_value": "example.com", "confidence": 0.9},
+            {"source": "web_search", "target_value": "example.com", "confidence": 0.4},
+        ]
+    )
+
+    assert all(isinstance(ev, Evidence) for ev in evidence)
+    assert [ev.source for ev in evidence] == ["whois", "web_search"]
+
+
+def test_evidence_validate_many_rejects_invalid_items():
+    with pytest.raises(ValidationError):
+        Evidence.validate_many(
+            [{"source": "whois", "target_value": "example.com", "confidence": 1.5}]
+        )
+
+
+def test_step_validate_many():
+    steps = Step.validate_many(
+        [{"id": "step_domain_001", "primitive": "whois", "cost_tier": "basic"}]
+    )
+
+    assert steps[0].cost_tier is CostTier.BASIC
+
+
+def test_evidence_risk_indicators_are_typed():
+    evidence = Evidence(
+        source="whois",
+        target_value="example.com",
+        risk_indicators=[
+            {"type": "new_domain", "severity": "high", "score_impact": 25}
+        ],
+        confidence=0.9,
+    )
+
+    indicator = evidence.risk_indicators[0]
+    assert isinstance(indicator, RiskIndicator)
+    assert indicator.severity is RiskLevel.HIGH
+    assert indicator.score_impact == 25
+
+
+def test_evidence_data_is_passed_through_untouched():
+    data = {"registrar": {"name": "Namecheap Inc."}}
+    evidence = Evidence(
+        source="whois", target_value="example.com", data=data, confidence=0.9
+    )
+
+    assert evidence.data is data
+
+    with pytest.raises(ValidationError):
+        Evidence(source="whois", target_value="example.com", data=[], confidence=0.9)
+
+
+def test_target_fast_domain_matches_validated_target():
+    fast = Target.fast_domain("Example.COM")
+    validated = Target(
+        value="Example.COM",
+        type=TargetType.DOMAIN,
+        normalized_value="example.com",
+        created_at=fast.created_at,
+    )
+
+    assert fast == validated
+    assert fast.type is TargetType.DOMAIN
+
+
+def test_investigation_validates_from_attributes():
+    class Row:
+        def __init__(self, **fields):
+            self.__dict__.update(fields)
+
+    row = Row(
+        id="inv_001",
+        target=Row(
+            value="example.com", type="domain", normalized_value="example.com"
+        ),
+        evidence_collected=[
+            Row(
+                source="whois",
+                target_value="example.com",
+                confidence=0.9,
+                risk_indicators=[Row(type="new_domain", severity="high")],
+            )
+        ],
+    )
+
+    investigation = Investigation.model_validate(row)
+
+    assert investigation.target.normalized_value == "example.com"
+    assert investigation.target.type is TargetType.DOMAIN
+    indicator = investigation.evidence_collected[0].risk_indicators[0]
+    assert indicator == RiskIndicator(type="new_domain", severity=RiskLevel.HIGH)
+
+
+def test_investigation_append_evidence_respects_max_evidence():
+    investigation = Investigation(
+        id="inv_001",
+        target=Target.fast_domain("example.com"),
+        settings={"max_evidence": 2},
+    )
+    sources = ["whois", "web_search", "reputation", "news_search"]
+
+    for i, source in enumerate(sources, 1):
+        investigation.append_evidence(
+            Evidence(source=source, target_value="example.com", confidence=0.5)
+        )
+        kept = [ev.source for ev in investigation.evidence_collected]
+        assert kept == sources[max(0, i - 2) : i]
+
+
+@pytest.mark.parametrize("limit", ["lots", "2", 2.9, True, -1])
+def test_investigation_append_evidence_rejects_invalid_max_evidence(limit):
+    investigation = Investigation(
+        id="inv_001",
+        target=Target.fast_domain("example.com"),
+        settings={"max_evidence": limit},
+    )
+
+    with pytest.raises(ValueError, match="max_evidence"):
+        investigation.append_evidence(
+            Evidence(source="whois", target_value="example.com", confidence=0.5)
+        )
+
+
+def test_risk_report_evidence_summary_round_trips():
+    report = RiskReport(
+        target_value="example.com",
+        score=40,
+        level=RiskLevel.MEDIUM,
+        confidence=0.8,
+        explanation="Newly registered domain",
+        investigation_id="inv_001",
+        evidence_summary=["Domain registered 5 days ago", "", "WHOIS privacy enabled"],
+    )
+
+    assert report.evidence_summary == (
+        "Domain registered 5 days ago",
+        "",
+        "WHOIS privacy enabled",
+    )
+
+    dumped = report.model_dump()
+    assert "evidence_summary_packed" not in dumped
+    assert dumped["evidence_summary"] == list(report.evidence_summary)
+    assert RiskReport.model_validate(dumped) == report
+
+
+def _summary_report(**kwargs):
+    return RiskReport(
+        target_value="example.com",
+        score=40,
+        level=RiskLevel.MEDIUM,
+        confidence=0.8,
+        explanation="Newly registered domain",
+        investigation_id="inv_001",
+        evidence_summary=["Domain registered 5 days ago"],
+        **kwargs,
+    )
+
+
+def test_risk_report_evidence_summary_setter_repacks():
+    report = _summary_report()
+
+    report.evidence_summary = [*report.evidence_summary, "WHOIS privacy enabled"]
+
+    assert report.evidence_summary == (
+        "Domain registered 5 days ago",
+        "WHOIS privacy enabled",
+    )
+    assert report.model_dump()["evidence_summary"] == list(report.evidence_summary)
+    with pytest.raises(AttributeError):
+        report.evidence_summary.append("lost")
+    with pytest.raises(ValueError):
+        report.evidence_summary = "not a list"
+
+
+def test_risk_report_model_copy_updates_evidence_summary():
+    report = _summary_report()
+
+    copied = report.model_copy(update={"evidence_summary": ["WHOIS privacy enabled"]})
+
+    assert copied.evidence_summary == ("WHOIS privacy enabled",)
+    assert report.evidence_summary == ("Domain registered 5 days ago",)
+    with pytest.raises(ValueError):
+        report.model_copy(update={"evidence_summary": [1, 2]})
+
+
+def test_risk_report_validation_schema_takes_evidence_summary():
+    properties = RiskReport.model_json_schema(mode="validation")["properties"]
+
+    assert properties["evidence_summary"]["items"] == {"type": "string"}
+    assert "evidence_summary_packed" not in properties
+    assert "evidence_summary_offsets" not in properties
+
+
+def test_risk_report_packs_evidence_summary_from_attributes():
+    class Row:
+        target_value = "example.com"
+        score = 40
+        level = "medium"
+        confidence = 0.8
+        explanation = "Newly registered domain"
+        investigation_id = "inv_001"
+        evidence_summary = ["Domain registered 5 days ago", "WHOIS privacy enabled"]
+
+    report = RiskReport.model_validate(Row())
+
+    assert report.evidence_summary == tuple(Row.evidence_summary)
+
+
+@pytest.mark.parametrize("offsets", [(5, 1, -1), (-1,), (0, 2, 9)])
+def test_risk_report_rejects_invalid_summary_offsets(offsets):
+    with pytest.raises(ValidationError):
+        RiskReport(
+            target_value="example.com",
+            score=40,
+            level=RiskLevel.MEDIUM,
+            confidence=0.8,
+            explanation="Newly registered domain",
+            investigation_id="inv_001",
+            evidence_summary_packed="abc",
+            evidence_summary_offsets=offsets,
+        )
+
+
+def test_evidence_json_round_trip():
+    evidence = [
+        Evidence(
+            source="whois",
+            target_value="example.com",
+            risk_indicators=[{"type": "new_domain", "severity": "high"}],
+            confidence=0.9,
+        )
+    ]
+
+    assert Evidence.validate_many_json(Evidence.dump_many_json(evidence)) == evidence
+
+
+def test_indicator_columns_from_evidence():
+    evidence = Evidence.validate_many(
+        [
+            {
+                "source": "whois",
+                "target_value": "example.com",
+                "risk_indicators": [
+                    {"type": "new_domain", "severity": "high", "score_impact": 25},
+                    {"type": "privacy", "severity": "low", "score_impact": 5},
+                ],
+                "confidence": 0.9,
+            },
+            {"source": "web_search", "target_value": "example.com", "confidence": 0.5},
+            {
+                "source": "reputation",
+                "target_value": "example.com",
+                "risk_indicators": [
+                    {"type": "blocklisted", "severity": "critical", "score_impact": 40}
+                ],
+                "confidence": 0.8,
+            },
+        ]
+    )
+
+    cols = IndicatorColumns.from_evidence(evidence)
+
+    assert len(cols) == 3
+    assert cols.types == ["new_domain", "privacy", "blocklisted"]
+    assert cols.details == ["", "", ""]
+    assert list(cols.score_impacts) == [25, 5, 40]
+
+
+@pytest.mark.parametrize("score_impact", [-1, 101, 2**31])
+def test_risk_indicator_score_impact_is_bounded(score_impact):
+    with pytest.raises(ValidationError):
+        RiskIndicator(type="new_domain", severity="high", score_impact=score_impact)
+
+
+def test_evidence_spills_large_raw_response(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOIR_ARTIFACT_DIR", str(tmp_path))
+    raw = "Domain Name: EXAMPLE.COM\n" * 100
+
+    evidence = Evidence(
+        source="whois", target_value="example.com", confidence=0.9, raw_response=raw
+    )
+    small = Evidence(
+        source="whois", target_value="example.com", confidence=0.9, raw_response="ok"
+    )
+
+    assert evidence.raw_response == ""
+    assert evidence.raw_response_ref is not None
+    assert evidence.load_raw_response() == raw
+    assert small.raw_response_ref is None
+    assert small.load_raw_response() == "ok"
+
+    dumped = Evidence.dump_many_json([evidence])
+    assert json.loads(dumped)[0]["raw_response"] == raw
+    assert b"raw_response_ref" not in dumped
+    assert str(tmp_path).encode() not in dumped
+
+
+def test_evidence_ignores_raw_response_ref_from_input(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOIR_ARTIFACT_DIR", str(tmp_path))
+    secret = tmp_path.parent / "secret.txt"
+    secret.write_text("do not leak")
+    payload = json.dumps(
+        {
+            "id": "inv_001",
+            "target": {
+                "value": "example.com",
+                "type": "domain",
+                "normalized_value": "example.com",
+            },
+            "evidence_collected": [
+                {
+                    "source": "whois",
+                    "target_value": "example.com",
+                    "confidence": 0.9,
+                    "raw_response_ref": str(secret),
+                }
+            ],
+        }
+    )
+
+    investigation = Investigation.model_validate_json(payload)
+
+    assert investigation.evidence_collected[0].raw_response_ref is None
+    assert "do not leak" not in investigation.model_dump_json()
+    schema = Investigation.model_json_schema()
+    assert "raw_response_ref" not in schema["$defs"]["Evidence"]["properties"]
+    with pytest.raises(TypeError):
+        Evidence.model_construct(
+            source="whois",
+            target_value="example.com",
+            confidence=0.9,
+            raw_response_ref=str(secret),
+        )
+
+
+def test_load_artifact_stays_inside_the_artifact_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOIR_ARTIFACT_DIR", str(tmp_path / "artifacts"))
+    outside = tmp_path / "outside.raw"
+    outside.write_text("do not leak")
+
+    assert load_artifact(str(outside)) is None
+    assert load_artifact(str(tmp_path / "artifacts" / ".." / "outside.raw")) is None
+    assert load_artifact(str(tmp_path / "artifacts" / "missing.raw")) is None
+
+
+def test_evidence_with_missing_artifact_still_serializes(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOIR_ARTIFACT_DIR", str(tmp_path))
+    evidence = Evidence(
+        source="whois",
+        target_value="example.com",
+        confidence=0.9,
+        raw_response="x" * 5000,
+    )
+    os.unlink(evidence.raw_response_ref)
+
+    assert json.loads(Evidence.dump_many_json([evidence]))[0]["raw_response"] == ""
+
+
+def test_evidence_model_construct_spills_large_raw_response(tmp_path, monkeypatch):
+    monkeypatch.setenv("NOIR_ARTIFACT_DIR", str(tmp_path))
+    raw = "x" * 5000
+
+    evidence = Evidence.model_construct(
+        source="whois", target_value="example.com", confidence=0.9, raw_response=raw
+    )
+
+    assert evidence.raw_response_ref is not None
+    assert evidence.load_raw_response() == raw
+
+
+def test_confidence_is_quantized_on_the_json_wire():
+    evidence = Evidence(
+        source="whois", target_value="example.com", confidence=0.8000000000000002
+    )
+
+    assert evidence.confidence == 0.8000000000000002
+    assert b'"confidence":0.8,' in Evidence.dump_many_json([evidence])
+
+
+def test_is_model():
+    assert is_model(Investigation)
+    assert is_model(Step)
+    assert not is_model(CostTier)
+    assert not is_model(Step(id="step_domain_001", primitive="whois"))
+
+
+def test_step_model_construct_skips_validation_and_fills_defaults():
+    step = Step.model_construct(id="step_domain_001", primitive="whois")
+
+    assert step == Step(id="step_domain_001", primitive="whois")
+
+    with pytest.raises(TypeError):
+        Step.model_construct(id="step_domain_001")
+    with pytest.raises(TypeError):
+        Step.model_construct(id="step_domain_001", primitive="whois", unknown=1)
+
+
+def test_step_model_construct_partial_binds_fields_once():
+    build = Step.model_construct_partial(primitive="whois", label="WHOIS", timeout_s=30)
+
+    step = build(
+        id="step_domain_001",
+        params={"domain": "example.com"},
+        parallel=False,
+        cost_tier=CostTier.FREE,
+    )
+
+    assert step == Step(
+        id="step_domain_001",
+        primitive="whois",
+        params={"domain": "example.com"},
+        label="WHOIS",
+        timeout_s=30,
+    )
+    with pytest.raises(TypeError):
+        build(id="step_domain_002")
+    with pytest.raises(TypeError):
+        Step.model_construct_partial(unknown=1)
+
+
+def test_step_model_copy_applies_update_without_touching_original():
+    step = Step(id="step_domain_001", primitive="whois", params={"domain": "a.com"})
+
+    copy = step.model_copy(update={"id": "step_domain_002"})
+
+    assert copy.id == "step_domain_002"
+    assert copy.params == step.params
+    assert step.id == "step_domain_001"
+    assert step.model_copy() == step
+
+
+def test_target_adapter_round_trip():
+    target = Target.fast_url("https://Example.com/login")
+
+    assert TARGET_ADAPTER.validate_json(TARGET_ADAPTER.dump_json(target)) == target
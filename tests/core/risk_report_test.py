@@ -0,0 +1,215 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.core.models import risk_report
+from app.core.models._cache import KeyValueCache, score_cache
+from app.core.models.enums import RiskLevel
+from app.core.models.evidence import Evidence
+from app.core.models.investigation import Investigation
+from app.core.models.risk_report import RiskReport
+from app.core.models.target import Target
+
+
+def _evidence(source, indicators, confidence=0.8):
+    return Evidence(
+        source=source,
+        target_value="suspicious.com",
+        risk_indicators=indicators,
+        confidence=confidence,
+    )
+
+
+def test_compute_from_evidence_takes_max_per_factor_and_sums_factors():
+    evidence = [
+        _evidence(
+            "whois",
+            [
+                {
+                    "type": "new_domain",
+                    "severity": "high",
+                    "detail": "Domain registered 5 days ago",
+                    "score_impact": 25,
+                },
+                {
+                    "type": "privacy_protected",
+                    "severity": "medium",
+                    "detail": "WHOIS privacy enabled",
+                    "score_impact": 10,
+                },
+            ],
+            confidence=0.9,
+        ),
+        # Same factor reported by a second source only counts once (MAX).
+        _evidence(
+            "web_search",
+            [{"type": "new_domain", "severity": "high", "score_impact": 20}],
+            confidence=0.7,
+        ),
+        _evidence(
+            "reputation",
+            [
+                {
+                    "type": "blocklisted",
+                    "severity": "critical",
+                    "detail": "Listed by safebrowsing",
+                    "score_impact": 40,
+                }
+            ],
+            confidence=0.8,
+        ),
+    ]
+
+    report = RiskReport.compute_from_evidence("inv_001", "suspicious.com", evidence)
+
+    assert report.score == 75
+    assert report.level is RiskLevel.HIGH
+    assert report.confidence == pytest.approx(0.8)
+    assert report.evidence_summary[0] == "Listed by safebrowsing"
+    assert report.metadata == {"evidence_count": 3, "indicator_count": 4}
+
+
+def test_compute_from_evidence_clips_score():
+    evidence = [
+        _evidence(
+            "reputation",
+            [
+                {"type": "blocklisted", "severity": "critical", "score_impact": 80},
+                {"type": "malware", "severity": "critical", "score_impact": 70},
+            ],
+        )
+    ]
+
+    report = RiskReport.compute_from_evidence("inv_001", "suspicious.com", evidence)
+
+    assert report.score == 100
+    assert report.level is RiskLevel.CRITICAL
+
+
+def test_compute_from_evidence_without_indicators():
+    report = RiskReport.compute_from_evidence(
+        "inv_001", "example.com", [_evidence("whois", [])]
+    )
+
+    assert report.score == 0
+    assert report.level is RiskLevel.LOW
+    assert report.evidence_summary == ()
+
+
+def test_from_investigation_reuses_cached_report(monkeypatch):
+    score_cache.clear()
+    evidence = [
+        _evidence(
+            "whois",
+            [{"type": "new_domain", "severity": "high", "score_impact": 25}],
+        )
+    ]
+    first = RiskReport.from_investigation(
+        Investigation(
+            id="inv_001",
+            target=Target.fast_domain("suspicious.com"),
+            evidence_collected=evidence,
+        )
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("expected a cache hit")
+
+    monkeypatch.setattr(RiskReport, "compute_from_evidence", fail)
+    second = RiskReport.from_investigation(
+        Investigation(
+            id="inv_002",
+            target=Target.fast_domain("suspicious.com"),
+            evidence_collected=[
+                _evidence(
+                    "whois",
+                    [{"type": "new_domain", "severity": "high", "score_impact": 25}],
+                )
+            ],
+        )
+    )
+
+    assert second.investigation_id == "inv_002"
+    assert second.score == first.score == 25
+    assert second.evidence_summary == first.evidence_summary
+    assert second.metadata["evidence_hash"].startswith("blake2b:")
+
+
+def test_cached_report_matches_a_fresh_computation(monkeypatch):
+    score_cache.clear()
+
+    def investigation(inv_id, confidence):
+        return Investigation(
+            id=inv_id,
+            target=Target.fast_domain("suspicious.com"),
+            evidence_collected=[
+                _evidence(
+                    "whois",
+                    [{"type": "new_domain", "severity": "high", "score_impact": 25}],
+                    confidence=confidence,
+                )
+            ],
+        )
+
+    first = RiskReport.from_investigation(investigation("inv_001", 0.9001))
+    later = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    monkeypatch.setattr(risk_report, "cached_utcnow", lambda: later)
+    hit = RiskReport.from_investigation(investigation("inv_002", 0.9001))
+    other = RiskReport.from_investigation(investigation("inv_003", 0.9004))
+
+    assert hit.confidence == first.confidence == 0.9001
+    assert hit.generated_at == later
+    assert other.confidence == 0.9004
+    assert other.metadata["evidence_hash"] != first.metadata["evidence_hash"]
+
+
+def test_report_does_not_depend_on_evidence_order():
+    score_cache.clear()
+    a = _evidence(
+        "whois",
+        [{"type": "new_domain", "severity": "high", "score_impact": 20}],
+        confidence=0.1,
+    )
+    b = _evidence(
+        "reputation",
+        [{"type": "blocklisted", "severity": "high", "score_impact": 20}],
+        confidence=0.2,
+    )
+    c = _evidence("web_search", [], confidence=0.7)
+
+    def report(evidence):
+        return RiskReport.from_investigation(
+            Investigation(
+                id="inv_001",
+                target=Target.fast_domain("suspicious.com"),
+                evidence_collected=evidence,
+            )
+        )
+
+    first = report([a, b, c])
+    cached = report([c, b, a])
+    fresh = RiskReport.compute_from_evidence("inv_001", "suspicious.com", [c, b, a])
+
+    assert first.evidence_summary == ("blocklisted", "new_domain")
+    assert cached.evidence_summary == fresh.evidence_summary == first.evidence_summary
+    assert cached.confidence == fresh.confidence == first.confidence
+
+
+def test_key_value_cache_persists_to_disk(tmp_path):
+    path = str(tmp_path / "cache" / "scores.sqlite3")
+    cache = KeyValueCache(path)
+    cache.set("key", "value")
+    cache.close()
+
+    assert KeyValueCache(path).get("key") == "value"
+
+
+def test_key_value_cache_evicts_oldest_writes():
+    cache = KeyValueCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("a", "3")  # rewritten, so "b" is now the oldest
+    cache.set("c", "4")
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == ("3", "4")